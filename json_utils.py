@@ -0,0 +1,36 @@
+"""
+JSON encode/decode helpers for Media Generator application.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise, so orjson stays an optional dependency.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching json.JSONDecodeError with either backend.
+
+Usage:
+    from json_utils import json_loads, json_dumps
+
+    data = json_loads(row['metadata'])
+    text = json_dumps(artifact.metadata)  # Always returns str (SQLite TEXT)
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def json_loads(data: Union[str, bytes]) -> Any:
+        """Decode JSON text using orjson"""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Encode object to a JSON string using orjson"""
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
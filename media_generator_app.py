@@ -21,6 +21,7 @@ import threading
 import queue
 import time
 import tkinter as tk
+from contextlib import closing
 from tkinter import ttk, scrolledtext, messagebox
 from typing import Optional
 
@@ -49,6 +50,10 @@ COLORS = {
     'status_error': '#CD5C5C',      # Indian Red (error state)
 }
 
+# Platform-specific commands resolved once at import time
+_OPENER = {'darwin': ['open'], 'win32': ['explorer']}.get(sys.platform, ['xdg-open'])
+_ACCEL_MOD = 'Command' if sys.platform == 'darwin' else 'Control'
+
 
 class SplashScreen:
     """Splash screen with solarpunk theme that displays for 5 seconds"""
@@ -769,9 +774,9 @@ class MediaGeneratorApp:
         help_menu.add_command(label="About", command=self.show_about)
 
         # Keyboard shortcuts
-        self.root.bind('<Command-r>' if sys.platform == 'darwin' else '<Control-r>', lambda e: self.refresh_unified_list())
-        self.root.bind('<Command-o>' if sys.platform == 'darwin' else '<Control-o>', lambda e: self.open_output_folder())
-        self.root.bind('<Command-q>' if sys.platform == 'darwin' else '<Control-q>', lambda e: self.root.quit())
+        self.root.bind(f'<{_ACCEL_MOD}-r>', lambda e: self.refresh_unified_list())
+        self.root.bind(f'<{_ACCEL_MOD}-o>', lambda e: self.open_output_folder())
+        self.root.bind(f'<{_ACCEL_MOD}-q>', lambda e: self.root.quit())
 
     # Icon map for prompt types
     ICON_MAP = {
@@ -893,11 +898,14 @@ class MediaGeneratorApp:
         # Find prompt in appropriate list
         try:
             if prompt_type == 'image_prompt':
-                prompts = self.prompt_repo.get_pending_image_prompts()
+                prompts = self.prompt_repo.iter_pending_image_prompts()
             else:
-                prompts = self.prompt_repo.get_pending_lyrics_prompts()
+                prompts = self.prompt_repo.iter_pending_lyrics_prompts()
 
-            prompt = next((p for p in prompts if p.id == prompt_id), None)
+            # Stops reading rows as soon as the prompt is found; closing()
+            # hands the connection back to the pool right away
+            with closing(prompts):
+                prompt = next((p for p in prompts if p.id == prompt_id), None)
 
             if prompt:
                 self.selected_prompt = prompt
@@ -977,11 +985,12 @@ class MediaGeneratorApp:
 
             try:
                 if prompt_type == 'image_prompt':
-                    prompts = self.prompt_repo.get_pending_image_prompts()
+                    prompts = self.prompt_repo.iter_pending_image_prompts()
                 else:
-                    prompts = self.prompt_repo.get_pending_lyrics_prompts()
+                    prompts = self.prompt_repo.iter_pending_lyrics_prompts()
 
-                prompt = next((p for p in prompts if p.id == prompt_id), None)
+                with closing(prompts):
+                    prompt = next((p for p in prompts if p.id == prompt_id), None)
                 if prompt:
                     prompts_to_generate.append((prompt_type, prompt))
             except Exception as e:
@@ -1329,12 +1338,7 @@ class MediaGeneratorApp:
         output_dir = self.config['comfyui']['output_directory']
 
         try:
-            if sys.platform == 'darwin':  # macOS
-                subprocess.run(['open', output_dir], check=True)
-            elif sys.platform == 'win32':  # Windows
-                subprocess.run(['explorer', output_dir], check=True)
-            else:  # Linux
-                subprocess.run(['xdg-open', output_dir], check=True)
+            subprocess.run(_OPENER + [output_dir], check=True)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open output folder:\n{str(e)}")
 
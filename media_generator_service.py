@@ -3,13 +3,18 @@
 Automated Media Generator Service
 
 Monitors database for pending media prompts and generates them automatically.
-Runs every 5 minutes via launchd.
+Runs every 5 minutes via launchd, or continuously with --daemon.
 """
 
 import sys
 import os
 import json
+import argparse
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
 # Add current directory to path
@@ -18,7 +23,19 @@ sys.path.insert(0, str(Path(__file__).parent))
 from models import PromptRecord, ImagePromptData, LyricsPromptData
 from repositories import PromptRepository, ArtifactRepository
 from executors import ImageWorkflowExecutor, AudioWorkflowExecutor
-from config import load_config, validate_config
+from config import load_config, validate_config, get_config_value
+from db_utils import force_wal_checkpoint
+
+# Optional: filesystem events instead of mtime polling in --daemon mode
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
+# Seconds between mtime checks when watchdog is unavailable
+_POLL_INTERVAL = 1.0
 
 
 def setup_logging():
@@ -34,6 +51,36 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+def _process_one(prompt, executor, data_cls, label, prompt_repo, artifact_repo, logger):
+    """Generate media for a single prompt and record the outcome
+
+    Args:
+        prompt: PromptRecord to generate
+        executor: Workflow executor for the prompt type
+        data_cls: ImagePromptData or LyricsPromptData
+        label: Prompt kind for log messages ('image' or 'lyrics')
+        prompt_repo: PromptRepository for error status updates
+        artifact_repo: ArtifactRepository for saving artifacts
+        logger: Logger instance
+    """
+    try:
+        logger.info(f"Processing {label} prompt #{prompt.id}")
+
+        json_data = data_cls.from_json(prompt.get_json_prompt())
+        artifacts = executor.generate(prompt, json_data)
+
+        # Artifacts + final status land in a single transaction; the batch
+        # checkpoints once at the end (process_pending_prompts)
+        artifact_repo.save_artifacts_atomic(
+            prompt.id, artifacts, final_status='ready', checkpoint=False
+        )
+        logger.info(f"Successfully generated {len(artifacts)} artifact(s) for {label} prompt #{prompt.id}")
+
+    except Exception as e:
+        logger.error(f"Failed to process {label} prompt #{prompt.id}: {e}")
+        prompt_repo.update_artifact_status(prompt.id, 'error', str(e))
+
+
 def process_pending_prompts(config, logger):
     """Process all pending media prompts"""
     db_path = config['database']['path']
@@ -52,54 +99,150 @@ def process_pending_prompts(config, logger):
         logger.info("No pending media prompts found")
         return 0
 
-    # Process image prompts
-    if image_prompts:
-        image_executor = ImageWorkflowExecutor(config)
-        for prompt in image_prompts:
-            try:
-                logger.info(f"Processing image prompt #{prompt.id}")
-                prompt_repo.update_artifact_status(prompt.id, 'processing')
+    # Build executors and pools before marking anything as processing: a
+    # setup error (e.g. missing workflow config, bad worker count) must leave
+    # the prompts pending rather than stuck in 'processing'
+    image_executor = ImageWorkflowExecutor(config) if image_prompts else None
+    audio_executor = AudioWorkflowExecutor(config) if lyrics_prompts else None
 
-                json_data = ImagePromptData.from_json(prompt.get_json_prompt())
-                artifacts = image_executor.generate(prompt, json_data)
+    process_one = partial(
+        _process_one,
+        prompt_repo=prompt_repo,
+        artifact_repo=artifact_repo,
+        logger=logger
+    )
 
-                for artifact in artifacts:
-                    artifact_repo.save_artifact(artifact)
+    # Image and lyrics prompts hit different backends, so run both pools at once
+    image_workers = get_config_value(config, 'concurrency.image', 1)
+    lyrics_workers = get_config_value(config, 'concurrency.lyrics', 1)
 
-                prompt_repo.update_artifact_status(prompt.id, 'ready')
-                logger.info(f"Successfully generated {len(artifacts)} image(s) for prompt #{prompt.id}")
+    futures = {}
+    with ThreadPoolExecutor(max_workers=image_workers, thread_name_prefix='image') as image_pool, \
+            ThreadPoolExecutor(max_workers=lyrics_workers, thread_name_prefix='lyrics') as lyrics_pool:
+        # Mark everything we picked up as processing in one transaction
+        prompt_repo.update_artifact_status_bulk(
+            [prompt.id for prompt in image_prompts + lyrics_prompts],
+            'processing'
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to process image prompt #{prompt.id}: {e}")
-                prompt_repo.update_artifact_status(prompt.id, 'error', str(e))
+        for prompt in image_prompts:
+            futures[image_pool.submit(
+                process_one, prompt, image_executor, ImagePromptData, 'image'
+            )] = prompt
 
-    # Process lyrics prompts
-    if lyrics_prompts:
-        audio_executor = AudioWorkflowExecutor(config)
         for prompt in lyrics_prompts:
+            futures[lyrics_pool.submit(
+                process_one, prompt, audio_executor, LyricsPromptData, 'lyrics'
+            )] = prompt
+
+        # _process_one handles generation errors itself; anything escaping it
+        # (e.g. the error-status update failing) must not vanish with the pool
+        total_processed = 0
+        for future in as_completed(futures):
             try:
-                logger.info(f"Processing lyrics prompt #{prompt.id}")
-                prompt_repo.update_artifact_status(prompt.id, 'processing')
+                future.result()
+                total_processed += 1
+            except Exception as e:
+                logger.error(f"Unhandled error for prompt #{futures[future].id}: {e}", exc_info=True)
 
-                json_data = LyricsPromptData.from_json(prompt.get_json_prompt())
-                artifacts = audio_executor.generate(prompt, json_data)
+    # Single checkpoint for the whole run so Docker containers see the results
+    force_wal_checkpoint(db_path, mode="TRUNCATE")
+
+    return total_processed
 
-                for artifact in artifacts:
-                    artifact_repo.save_artifact(artifact)
 
-                prompt_repo.update_artifact_status(prompt.id, 'ready')
-                logger.info(f"Successfully generated {len(artifacts)} audio file(s) for prompt #{prompt.id}")
+def _db_mtimes(db_path):
+    """Modification times of the database and its WAL file (None if missing)"""
+    mtimes = []
+    for path in (db_path, db_path + '-wal'):
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
 
+
+if HAS_WATCHDOG:
+    class _DatabaseChangeHandler(FileSystemEventHandler):
+        """Sets an event when the database or its WAL file is modified"""
+
+        def __init__(self, db_path, changed):
+            super().__init__()
+            self._paths = {os.path.abspath(db_path), os.path.abspath(db_path) + '-wal'}
+            self._changed = changed
+
+        def on_any_event(self, event):
+            if os.path.abspath(event.src_path) in self._paths:
+                self._changed.set()
+
+
+def run_daemon(config, logger, timeout):
+    """Process prompts in a loop, sleeping until the database changes
+
+    After each pass the service waits for a write to the database (or its
+    WAL file) from the poets service, falling back to a pass every
+    `timeout` seconds. Uses watchdog when installed, mtime polling otherwise.
+
+    Args:
+        config: Configuration dictionary
+        logger: Logger instance
+        timeout: Maximum seconds between passes
+    """
+    db_path = config['database']['path']
+    changed = threading.Event()
+    observer = None
+
+    if HAS_WATCHDOG:
+        observer = Observer()
+        observer.schedule(
+            _DatabaseChangeHandler(db_path, changed),
+            os.path.dirname(os.path.abspath(db_path)),
+            recursive=False
+        )
+        observer.start()
+        logger.info("Daemon mode: watching database with watchdog")
+    else:
+        logger.info("Daemon mode: polling database mtime (install watchdog for events)")
+
+    try:
+        while True:
+            # Arm the wake-up before the pass: writes that land while it runs
+            # (ours included) trigger another pass instead of being missed
+            changed.clear()
+            baseline = _db_mtimes(db_path)
+
+            try:
+                processed = process_pending_prompts(config, logger)
+                if processed:
+                    logger.info(f"Processed {processed} prompt(s)")
             except Exception as e:
-                logger.error(f"Failed to process lyrics prompt #{prompt.id}: {e}")
-                prompt_repo.update_artifact_status(prompt.id, 'error', str(e))
+                logger.error(f"Service error: {e}", exc_info=True)
 
-    total_processed = len(image_prompts) + len(lyrics_prompts)
-    return total_processed
+            if observer is not None:
+                changed.wait(timeout)
+            else:
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline and _db_mtimes(db_path) == baseline:
+                    time.sleep(_POLL_INTERVAL)
+
+    except KeyboardInterrupt:
+        logger.info("Media Generator Service - Stopped")
+
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='Automated Media Generator Service')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep running and process prompts as they arrive')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help='Daemon mode: max seconds between passes (default: 30)')
+    args = parser.parse_args()
+
     logger = setup_logging()
     logger.info("=" * 60)
     logger.info("Media Generator Service - Starting")
@@ -122,6 +265,10 @@ def main():
                 logger.error(f"  - {issue}")
             return 1
 
+        if args.daemon:
+            run_daemon(config, logger, args.timeout)
+            return 0
+
         # Process pending prompts
         processed = process_pending_prompts(config, logger)
         logger.info(f"Processed {processed} prompt(s)")
@@ -3,18 +3,50 @@ Data models for Media Generator application.
 
 Defines dataclasses for:
 - PromptRecord: Database prompt records with JSON content
+- Writing: One linked writings row of a prompt (lightweight named tuple)
 - ImagePromptData: Parsed image prompt JSON structure
 - LyricsPromptData: Parsed lyrics prompt JSON structure
 - ArtifactRecord: Generated artifact metadata
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, NamedTuple
 from datetime import datetime
+import io
 import json
+import sys
+from json_utils import json_loads
 
+# slots=True needs Python 3.10+; older interpreters get regular dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Shared stand-in for missing JSON sections (only ever read, never mutated)
+_EMPTY_SECTION: Dict[str, Any] = {}
+
+
+@lru_cache(maxsize=256)
+def _parse_prompt_json(content: str) -> Dict[str, Any]:
+    """Decode writing JSON, memoized by content for the whole process
+
+    Pending prompts are re-queried on every GUI refresh/selection and on
+    service retries, producing new PromptRecords for unchanged writings.
+    The returned dict is shared between records and must not be mutated.
+    """
+    return json_loads(content)
+
+
+class Writing(NamedTuple):
+    """Writing linked to a prompt via prompt_writings"""
+
+    writing_id: int
+    writing_order: int
+    content: Optional[str]  # JSON string
+    content_type: str
+    title: Optional[str]
+
+
+@dataclass(**_SLOTS)
 class PromptRecord:
     """Database prompt record with JSON content from writings table"""
 
@@ -33,10 +65,15 @@ class PromptRecord:
     writing_id: Optional[int] = None  # writings.id
 
     # NEW: Support multiple writings
-    writings: List[Dict[str, Any]] = field(default_factory=list)
+    writings: List[Writing] = field(default_factory=list)
+
+    # Parsed JSON cache filled by get_json_prompt()
+    _parsed: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
-    def primary_writing(self) -> Optional[Dict[str, Any]]:
+    def primary_writing(self) -> Optional[Writing]:
         """Get the primary (most recent) writing"""
         return self.writings[-1] if self.writings else None
 
@@ -48,11 +85,11 @@ class PromptRecord:
         The 'status' field is the poets service's concern.
         The 'artifact_status' field determines if media needs generation.
         """
-        # Support both legacy and new structure
-        has_content = self.json_content is not None or len(self.writings) > 0
+        # Status first so non-pending records skip the content check;
+        # content may be in either the legacy field or the writings list
         return (
             self.artifact_status == 'pending'
-            and has_content
+            and (self.json_content is not None or bool(self.writings))
         )
 
     def get_json_prompt(self) -> Dict[str, Any]:
@@ -60,13 +97,20 @@ class PromptRecord:
 
         Returns primary (most recent) writing's JSON content.
         For backward compatibility, falls back to legacy json_content field.
+        The parsed result is cached, so repeated calls don't re-parse.
         """
+        if self._parsed is None:
+            self._parsed = self._parse_json_prompt()
+        return self._parsed
+
+    def _parse_json_prompt(self) -> Dict[str, Any]:
+        """Parse the primary writing (or legacy json_content) into a dict"""
         # Try new structure first
         if self.writings:
             primary = self.primary_writing
-            if primary and 'content' in primary:
+            if primary.content is not None:
                 try:
-                    return json.loads(primary['content'])
+                    return _parse_prompt_json(primary.content)
                 except json.JSONDecodeError:
                     pass
 
@@ -74,12 +118,12 @@ class PromptRecord:
         if not self.json_content:
             return {}
         try:
-            return json.loads(self.json_content)
+            return _parse_prompt_json(self.json_content)
         except json.JSONDecodeError:
             return {}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ImagePromptData:
     """Parsed image prompt JSON structure"""
 
@@ -114,8 +158,8 @@ class ImagePromptData:
             }
         }
         """
-        tech = data.get('technical_params', {})
-        comp = data.get('composition', {})
+        tech = data.get('technical_params') or _EMPTY_SECTION
+        comp = data.get('composition') or _EMPTY_SECTION
 
         return cls(
             prompt=data.get('prompt', ''),
@@ -130,7 +174,18 @@ class ImagePromptData:
         )
 
 
-@dataclass
+# (label, attribute, value to omit) for LyricsPromptData.get_tags_string()
+_TAG_SPEC = (
+    ('Genre', 'genre', None),
+    ('Mood', 'mood', None),
+    ('Tempo', 'tempo', None),
+    ('Key', 'key', None),
+    ('Time Signature', 'time_signature', '4/4'),  # 4/4 is the default, omit it
+    ('Vocal Style', 'vocal_style', None),
+)
+
+
+@dataclass(**_SLOTS)
 class LyricsPromptData:
     """Parsed lyrics prompt JSON structure"""
 
@@ -173,7 +228,7 @@ class LyricsPromptData:
             }
         }
         """
-        meta = data.get('metadata', {})
+        meta = data.get('metadata') or _EMPTY_SECTION
 
         return cls(
             title=data.get('title', ''),
@@ -197,8 +252,8 @@ class LyricsPromptData:
         [Chorus]
         lyrics...
         """
-        lyrics_parts = []
-        for section in self.structure:
+        buf = io.StringIO()
+        for index, section in enumerate(self.structure):
             section_type = section.get('type', '')
             section_number = section.get('number', '')
             lyrics = section.get('lyrics', '')
@@ -206,15 +261,22 @@ class LyricsPromptData:
             # Capitalize first letter of section type
             section_type = section_type.capitalize() if section_type else ''
 
+            # Blank line between sections
+            if index:
+                buf.write("\n")
+
             # Format section header with number if present
+            buf.write("[")
+            buf.write(section_type)
             if section_number:
-                header = f"[{section_type} {section_number}]"
-            else:
-                header = f"[{section_type}]"
+                buf.write(" ")
+                buf.write(str(section_number))
+            buf.write("]\n")
 
-            lyrics_parts.append(f"{header}\n{lyrics}\n")
+            buf.write(str(lyrics))
+            buf.write("\n")
 
-        return "\n".join(lyrics_parts)
+        return buf.getvalue()
 
     def get_tags_string(self) -> str:
         """Format tags for ACE audio workflow
@@ -225,25 +287,11 @@ class LyricsPromptData:
         Returns:
             Formatted tags string with all musical parameters
         """
-        tags_parts = []
-
-        if self.genre:
-            tags_parts.append(f"Genre: {self.genre}")
-
-        if self.mood:
-            tags_parts.append(f"Mood: {self.mood}")
-
-        if self.tempo:
-            tags_parts.append(f"Tempo: {self.tempo}")
-
-        if self.key:
-            tags_parts.append(f"Key: {self.key}")
-
-        if self.time_signature and self.time_signature != '4/4':
-            tags_parts.append(f"Time Signature: {self.time_signature}")
-
-        if self.vocal_style:
-            tags_parts.append(f"Vocal Style: {self.vocal_style}")
+        tags_parts = [
+            f"{label}: {value}"
+            for label, attr, skip_value in _TAG_SPEC
+            if (value := getattr(self, attr)) and value != skip_value
+        ]
 
         if self.instrumentation:
             instruments_str = ", ".join(self.instrumentation)
@@ -252,7 +300,7 @@ class LyricsPromptData:
         return "\n".join(tags_parts)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ArtifactRecord:
     """Generated artifact metadata for database storage"""
 
@@ -6,13 +6,344 @@ Provides database access classes:
 - ArtifactRepository: Manage prompt_artifacts table
 
 Uses SQLite with WAL mode and proper timeout handling for concurrent access.
+Connections are pooled per database path and shared by both repositories;
+queries use a separate pool of read-only connections.
 """
 
 import sqlite3
 import json
-from typing import List, Optional
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
-from models import PromptRecord, ArtifactRecord
+from models import PromptRecord, ArtifactRecord, Writing
+from json_utils import json_loads, json_dumps
+from db_utils import force_wal_checkpoint
+
+logger = logging.getLogger(__name__)
+
+
+# Idle connections kept per database path (read-write and read-only each)
+POOL_SIZE = 4
+
+_pools: Dict[Tuple[str, bool], queue.Queue] = {}
+_pools_lock = threading.Lock()
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Database paths already initialized (WAL mode, indexes) in this process
+_initialized_paths = set()
+
+# Indexes backing the repository queries. The partial indexes only hold
+# pending/processing rows, so they stay small while prompts history grows;
+# the pending one returns rows already ordered by created_at.
+_INDEX_STATEMENTS = (
+    """
+    CREATE INDEX IF NOT EXISTS idx_prompts_pending
+    ON prompts(prompt_type, created_at)
+    WHERE artifact_status = 'pending'
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_prompts_processing
+    ON prompts(processed_at)
+    WHERE artifact_status = 'processing'
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_prompt_writings_prompt
+    ON prompt_writings(prompt_id, writing_order)
+    """,
+)
+
+
+# Pending prompts of one prompt_type, oldest first, joined with their
+# writings (one row per writing). w.id is NULL for prompts without writings
+# and for links to writings of another type. LIMIT applies to prompts.
+# The first 9 columns follow PromptRecord field order (bound positionally).
+# NOTE: Only filter on artifact_status, not on status!
+# The 'status' field is the poets service's concern (whether IT completed)
+# The 'artifact_status' field is our concern (whether media needs generation)
+_PENDING_PROMPTS_SQL = """
+SELECT
+    p.id,
+    p.prompt_text,
+    p.prompt_type,
+    p.status,
+    p.artifact_status,
+    p.output_reference,
+    p.created_at AS "created_at [TIMESTAMP]",
+    p.completed_at AS "completed_at [TIMESTAMP]",
+    p.error_message,
+    w.id,
+    pw.writing_order,
+    w.content,
+    w.content_type,
+    w.title
+FROM (
+    SELECT *
+    FROM prompts
+    WHERE artifact_status = 'pending'
+      AND prompt_type = '{prompt_type}'
+    ORDER BY created_at ASC
+    LIMIT ?
+) p
+LEFT JOIN prompt_writings pw ON pw.prompt_id = p.id
+LEFT JOIN writings w
+    ON w.id = pw.writing_id
+   AND w.content_type = '{prompt_type}'
+ORDER BY p.created_at ASC, p.id ASC, pw.writing_order ASC
+"""
+
+_PENDING_IMAGE_SQL = _PENDING_PROMPTS_SQL.format(prompt_type='image_prompt')
+_PENDING_LYRICS_SQL = _PENDING_PROMPTS_SQL.format(prompt_type='lyrics_prompt')
+
+# Diagnostics for iter_pending_lyrics_prompts (DEBUG logging only)
+_LYRICS_STATS_SQL = """
+SELECT COUNT(*) as total,
+       SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as status_completed,
+       SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as status_failed,
+       SUM(CASE WHEN artifact_status = 'pending' THEN 1 ELSE 0 END) as artifact_pending,
+       SUM(CASE WHEN artifact_status = 'ready' THEN 1 ELSE 0 END) as artifact_ready
+FROM prompts
+WHERE prompt_type = 'lyrics_prompt'
+"""
+
+_RECENT_LYRICS_SQL = """
+SELECT id, prompt_text, status, artifact_status, created_at
+FROM prompts
+WHERE prompt_type = 'lyrics_prompt'
+ORDER BY created_at DESC
+LIMIT 10
+"""
+
+_UPDATE_STATUS_SQL = """
+UPDATE prompts
+SET artifact_status = ?
+WHERE id = ?
+"""
+
+# A NULL error message leaves the stored one untouched
+_UPDATE_STATUS_ERR_SQL = """
+UPDATE prompts
+SET artifact_status = ?, error_message = COALESCE(?, error_message)
+WHERE id = ?
+"""
+
+# Use processed_at since that's when status was set to 'processing'.
+# Driven by idx_prompts_processing; the bound modifier is e.g. '-30 minutes'.
+_RESET_STALE_SQL = """
+UPDATE prompts
+SET artifact_status = 'pending',
+    error_message = 'Reset from stale processing state'
+WHERE artifact_status = 'processing'
+  AND processed_at IS NOT NULL
+  AND processed_at < datetime('now', ?)
+"""
+
+_INSERT_ARTIFACT_SQL = """
+INSERT INTO prompt_artifacts (
+    prompt_id,
+    artifact_type,
+    file_path,
+    preview_path,
+    metadata,
+    created_at,
+    updated_at
+) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+"""
+
+_ARTIFACTS_FOR_PROMPT_SQL = """
+SELECT
+    id,
+    prompt_id,
+    artifact_type,
+    file_path,
+    preview_path,
+    metadata,
+    created_at AS "created_at [TIMESTAMP]"
+FROM prompt_artifacts
+WHERE prompt_id = ?
+ORDER BY created_at DESC
+"""
+
+
+def _convert_timestamp(value: bytes) -> datetime:
+    """SQLite converter for columns selected as "[TIMESTAMP]"
+
+    Handles CURRENT_TIMESTAMP ('YYYY-MM-DD HH:MM:SS') as well as ISO 8601
+    values with 'T', fractional seconds or a 'Z' suffix. NULLs never reach
+    the converter, so nullable columns still come back as None.
+
+    Args:
+        value: Raw column bytes from SQLite
+
+    Returns:
+        datetime object (current time if the value can't be parsed)
+    """
+    text = value.decode()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        # Last resort: return current time
+        return datetime.now()
+
+
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+
+
+def _open_connection(db_path: str, readonly: bool = False) -> sqlite3.Connection:
+    """Open a new pooled connection with row factory and per-connection settings
+
+    check_same_thread is disabled because a pooled connection may be reused
+    by a different thread; the pool hands each connection to one caller at a time.
+    Columns declared or aliased as TIMESTAMP are returned as datetime objects.
+
+    Connections run in autocommit mode (isolation_level=None): single
+    statements commit on their own, and multi-statement writes open an
+    explicit BEGIN IMMEDIATE so the write lock is taken once per batch.
+
+    Read-only connections are opened with a mode=ro URI; under WAL they
+    read alongside writers and can never take the write lock.
+
+    Args:
+        db_path: Path to SQLite database file
+        readonly: Open the database read-only
+
+    Returns:
+        Configured SQLite connection
+    """
+    if readonly:
+        database, uri = Path(db_path).absolute().as_uri() + '?mode=ro', True
+    else:
+        database, uri = db_path, False
+
+    conn = sqlite3.connect(
+        database,
+        timeout=30.0,
+        check_same_thread=False,
+        isolation_level=None,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        uri=uri
+    )
+    conn.row_factory = sqlite3.Row
+
+    # journal_mode=WAL persists in the database file; see ensure_db_initialized()
+    if not readonly:
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # Read pages via 256MB mmap
+    conn.execute("PRAGMA wal_autocheckpoint=1000")  # SQLite default, made explicit
+
+    return conn
+
+
+def _get_pool(db_path: str, readonly: bool = False) -> queue.Queue:
+    """Get (or create) the idle-connection pool for a database path"""
+    key = (db_path, readonly)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = queue.Queue(maxsize=POOL_SIZE)
+            _pools[key] = pool
+        return pool
+
+
+def ensure_db_initialized(db_path: str) -> None:
+    """One-time database setup: WAL journal mode and query indexes
+
+    WAL mode is stored in the database file header, so it is set here once
+    per path per process rather than on every new connection. Both
+    repositories call this on construction.
+
+    Non-critical: if the database is read-only or a table doesn't exist
+    yet, queries still work (without WAL or without that index). The path
+    is only marked initialized once every statement has succeeded, so a
+    transient error (e.g. "database is locked") or a missing table is
+    retried by the next repository constructed for it.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    with _pools_lock:
+        if db_path in _initialized_paths:
+            return
+
+    try:
+        with pooled_connection(db_path) as conn:
+            # Enable WAL mode for concurrent access
+            journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if journal_mode.lower() != 'wal':
+                logger.warning("Could not enable WAL mode for %s (journal_mode=%s)", db_path, journal_mode)
+
+            complete = True
+            for statement in _INDEX_STATEMENTS:
+                try:
+                    conn.execute(statement)
+                except sqlite3.Error:
+                    complete = False
+    except sqlite3.Error as e:
+        logger.warning("Database initialization failed for %s: %s", db_path, e)
+        return
+
+    if complete:
+        with _pools_lock:
+            _initialized_paths.add(db_path)
+
+
+@contextmanager
+def pooled_connection(db_path: str, readonly: bool = False) -> Iterator[sqlite3.Connection]:
+    """Borrow a connection from the pool for the duration of a with-block
+
+    Commits any open transaction on success and rolls it back on exception
+    (same semantics as using a sqlite3.Connection as a context manager),
+    then returns the connection to the pool. Connections beyond POOL_SIZE are closed instead.
+    A generator closed while borrowing (GeneratorExit) still returns its
+    rolled-back connection; other exceptions close it.
+
+    Args:
+        db_path: Path to SQLite database file
+        readonly: Borrow from the separate read-only pool
+
+    Yields:
+        SQLite connection with row factory configured
+    """
+    pool = _get_pool(db_path, readonly)
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _open_connection(db_path, readonly)
+
+    try:
+        with conn:
+            yield conn
+    except GeneratorExit:
+        # An iter_* generator closed early: `with conn` rolled back, so the
+        # connection is in a clean state and can be reused
+        _return_to_pool(pool, conn)
+        raise
+    except BaseException:
+        # Don't recycle a connection that may be in an unknown state
+        conn.close()
+        raise
+
+    _return_to_pool(pool, conn)
+
+
+def _return_to_pool(pool: queue.Queue, conn: sqlite3.Connection) -> None:
+    """Put a connection back in its pool, closing it if the pool is full"""
+    try:
+        pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
 
 
 class PromptRepository:
@@ -25,22 +356,25 @@ class PromptRepository:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        ensure_db_initialized(db_path)
 
-    def get_connection(self) -> sqlite3.Connection:
-        """Create database connection with row factory and WAL mode
+    def get_connection(self):
+        """Borrow a pooled database connection
+
+        Use as a context manager: ``with repo.get_connection() as conn:``
 
         Returns:
-            SQLite connection with row factory configured
+            Context manager yielding a SQLite connection with row factory configured
         """
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row
+        return pooled_connection(self.db_path)
 
-        # Enable WAL mode for concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA busy_timeout=30000")
+    def get_read_connection(self):
+        """Borrow a pooled read-only database connection (for queries)
 
-        return conn
+        Returns:
+            Context manager yielding a read-only SQLite connection
+        """
+        return pooled_connection(self.db_path, readonly=True)
 
     def get_pending_image_prompts(self, limit: int = 100) -> List[PromptRecord]:
         """Query all pending image prompts with ALL their writings
@@ -51,233 +385,99 @@ class PromptRepository:
         Returns:
             List of PromptRecord objects with all writings populated
         """
-        # First get the prompts
-        # NOTE: Only filter on artifact_status, not on status!
-        # The 'status' field is the poets service's concern (whether IT completed)
-        # The 'artifact_status' field is our concern (whether media needs generation)
-        prompt_query = """
-        SELECT
-            p.id,
-            p.prompt_text,
-            p.prompt_type,
-            p.status,
-            p.artifact_status,
-            p.output_reference,
-            p.created_at,
-            p.completed_at,
-            p.error_message
-        FROM prompts p
-        WHERE p.artifact_status = 'pending'
-          AND p.prompt_type = 'image_prompt'
-        ORDER BY p.created_at ASC
-        LIMIT ?
-        """
+        return list(self.iter_pending_image_prompts(limit))
 
-        # Then get all writings for each prompt
-        writings_query = """
-        SELECT
-            pw.writing_id,
-            pw.writing_order,
-            w.content,
-            w.content_type,
-            w.title
-        FROM prompt_writings pw
-        JOIN writings w ON pw.writing_id = w.id
-        WHERE pw.prompt_id = ?
-          AND w.content_type = 'image_prompt'
-        ORDER BY pw.writing_order ASC
-        """
+    def iter_pending_image_prompts(self, limit: int = 100) -> Iterator[PromptRecord]:
+        """Stream pending image prompts with ALL their writings
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        Rows are read from the cursor one at a time, so only the record
+        being yielded is held in memory. The connection stays borrowed
+        until the iterator is exhausted or closed.
 
-            # Force checkpoint to see latest data from poets service
-            try:
-                cursor.execute("PRAGMA wal_checkpoint(PASSIVE)")
-            except sqlite3.Error:
-                # Non-critical, continue anyway
-                pass
-
-            # Get prompts
-            cursor.execute(prompt_query, (limit,))
-            prompt_rows = cursor.fetchall()
-
-            results = []
-            for prompt_row in prompt_rows:
-                prompt_id = prompt_row['id']
-
-                # Get all writings for this prompt
-                cursor.execute(writings_query, (prompt_id,))
-                writing_rows = cursor.fetchall()
-
-                # Build writings list
-                writings = []
-                for w_row in writing_rows:
-                    writings.append({
-                        'writing_id': w_row['writing_id'],
-                        'writing_order': w_row['writing_order'],
-                        'content': w_row['content'],
-                        'content_type': w_row['content_type'],
-                        'title': w_row['title']
-                    })
-
-                # Create PromptRecord
-                record = PromptRecord(
-                    id=prompt_row['id'],
-                    prompt_text=prompt_row['prompt_text'],
-                    prompt_type=prompt_row['prompt_type'],
-                    status=prompt_row['status'],
-                    artifact_status=prompt_row['artifact_status'],
-                    output_reference=prompt_row['output_reference'],
-                    created_at=self._parse_datetime(prompt_row['created_at']),
-                    completed_at=self._parse_datetime(prompt_row['completed_at']) if prompt_row['completed_at'] else None,
-                    error_message=prompt_row['error_message'],
-                    writings=writings,
-                    # Legacy fields for backward compatibility
-                    writing_id=writings[0]['writing_id'] if writings else None,
-                    json_content=writings[0]['content'] if writings else None
-                )
-
-                results.append(record)
-
-            return results
+        Args:
+            limit: Maximum number of prompts to return
+
+        Yields:
+            PromptRecord objects with all writings populated
+        """
+        # No checkpoint needed: a WAL reader already sees every commit
+        # from the poets service, and autocheckpoint keeps the WAL bounded
+        with self.get_read_connection() as conn:
+            # Stream joined rows as plain tuples, one PromptRecord per prompt
+            prompt_cursor = conn.cursor()
+            prompt_cursor.row_factory = None
+            prompt_cursor.execute(_PENDING_IMAGE_SQL, (limit,))
+            yield from self._rows_to_prompt_records(prompt_cursor)
 
     def get_pending_lyrics_prompts(self, limit: int = 100) -> List[PromptRecord]:
         """Query all pending lyrics prompts with ALL their writings
 
-        Only returns 'lyrics_prompt' type (structured JSON format).
-        Old 'song' type prompts used raw text format incompatible with ace_audio_workflow.
-
         Args:
             limit: Maximum number of prompts to return
 
         Returns:
             List of PromptRecord objects with all writings populated
         """
-        # First get the prompts
-        # NOTE: Only filter on artifact_status, not on status!
-        # The 'status' field is the poets service's concern (whether IT completed)
-        # The 'artifact_status' field is our concern (whether media needs generation)
-        prompt_query = """
-        SELECT
-            p.id,
-            p.prompt_text,
-            p.prompt_type,
-            p.status,
-            p.artifact_status,
-            p.output_reference,
-            p.created_at,
-            p.completed_at,
-            p.error_message
-        FROM prompts p
-        WHERE p.artifact_status = 'pending'
-          AND p.prompt_type = 'lyrics_prompt'
-        ORDER BY p.created_at ASC
-        LIMIT ?
-        """
+        return list(self.iter_pending_lyrics_prompts(limit))
+
+    def iter_pending_lyrics_prompts(self, limit: int = 100) -> Iterator[PromptRecord]:
+        """Stream pending lyrics prompts with ALL their writings
+
+        Only returns 'lyrics_prompt' type (structured JSON format).
+        Old 'song' type prompts used raw text format incompatible with ace_audio_workflow.
+        Rows are read from the cursor one at a time (see iter_pending_image_prompts).
+
+        Args:
+            limit: Maximum number of prompts to return
 
-        # Then get all writings for each prompt
-        writings_query = """
-        SELECT
-            pw.writing_id,
-            pw.writing_order,
-            w.content,
-            w.content_type,
-            w.title
-        FROM prompt_writings pw
-        JOIN writings w ON pw.writing_id = w.id
-        WHERE pw.prompt_id = ?
-          AND w.content_type = 'lyrics_prompt'
-        ORDER BY pw.writing_order ASC
+        Yields:
+            PromptRecord objects with all writings populated
         """
+        with self.get_read_connection() as conn:
+            # Diagnostic queries scan every lyrics prompt; only run when asked for
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_lyrics_diagnostics(conn)
+
+            # Stream joined rows as plain tuples, one PromptRecord per prompt
+            returned = 0
+            prompt_cursor = conn.cursor()
+            prompt_cursor.row_factory = None
+            prompt_cursor.execute(_PENDING_LYRICS_SQL, (limit,))
+            for record in self._rows_to_prompt_records(prompt_cursor):
+                returned += 1
+                logger.debug("Prompt #%s has %d writings", record.id, len(record.writings))
+                yield record
+
+            logger.debug(
+                "Query returned %d lyrics prompts matching criteria (artifact_status='pending')",
+                returned
+            )
+
+    def _log_lyrics_diagnostics(self, conn: sqlite3.Connection) -> None:
+        """Log lyrics prompt status counts and the most recent lyrics prompts
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        Args:
+            conn: Open database connection
+        """
+        # Check total lyrics_prompt records regardless of status
+        stats = conn.execute(_LYRICS_STATS_SQL).fetchone()
+        logger.debug("Lyrics prompts in DB: total=%s", stats['total'])
+        logger.debug(
+            "Status breakdown: completed=%s, failed=%s",
+            stats['status_completed'], stats['status_failed']
+        )
+        logger.debug(
+            "Artifact breakdown: pending=%s, ready=%s",
+            stats['artifact_pending'], stats['artifact_ready']
+        )
 
-            # Force checkpoint to see latest data from poets service
-            try:
-                checkpoint_result = cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-                checkpoint_info = checkpoint_result.fetchone()
-                print(f"[DEBUG] WAL checkpoint (lyrics): {checkpoint_info}")
-            except sqlite3.Error as e:
-                # Non-critical, continue anyway
-                print(f"[DEBUG] WAL checkpoint failed: {e}")
-
-            # Debug: Check total lyrics_prompt records regardless of status
-            cursor.execute("""
-                SELECT COUNT(*) as total,
-                       SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as status_completed,
-                       SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as status_failed,
-                       SUM(CASE WHEN artifact_status = 'pending' THEN 1 ELSE 0 END) as artifact_pending,
-                       SUM(CASE WHEN artifact_status = 'ready' THEN 1 ELSE 0 END) as artifact_ready
-                FROM prompts
-                WHERE prompt_type = 'lyrics_prompt'
-            """)
-            stats = cursor.fetchone()
-            print(f"[DEBUG] Lyrics prompts in DB: total={stats['total']}")
-            print(f"        Status breakdown: completed={stats['status_completed']}, failed={stats['status_failed']}")
-            print(f"        Artifact breakdown: pending={stats['artifact_pending']}, ready={stats['artifact_ready']}")
-
-            # Debug: Show recent lyrics prompts with their statuses
-            cursor.execute("""
-                SELECT id, prompt_text, status, artifact_status, created_at
-                FROM prompts
-                WHERE prompt_type = 'lyrics_prompt'
-                ORDER BY created_at DESC
-                LIMIT 10
-            """)
-            recent = cursor.fetchall()
-            print(f"[DEBUG] Recent lyrics prompts:")
-            for r in recent:
-                print(f"  - ID={r['id']}, status='{r['status']}', artifact_status='{r['artifact_status']}', created={r['created_at']}, text='{r['prompt_text'][:50]}...'")
-
-            # Get prompts
-            cursor.execute(prompt_query, (limit,))
-            prompt_rows = cursor.fetchall()
-
-            print(f"[DEBUG] Query returned {len(prompt_rows)} lyrics prompts matching criteria (artifact_status='pending')")
-
-            results = []
-            for prompt_row in prompt_rows:
-                prompt_id = prompt_row['id']
-
-                # Get all writings for this prompt
-                cursor.execute(writings_query, (prompt_id,))
-                writing_rows = cursor.fetchall()
-
-                print(f"[DEBUG] Prompt #{prompt_id} has {len(writing_rows)} writings")
-
-                # Build writings list
-                writings = []
-                for w_row in writing_rows:
-                    writings.append({
-                        'writing_id': w_row['writing_id'],
-                        'writing_order': w_row['writing_order'],
-                        'content': w_row['content'],
-                        'content_type': w_row['content_type'],
-                        'title': w_row['title']
-                    })
-
-                # Create PromptRecord
-                record = PromptRecord(
-                    id=prompt_row['id'],
-                    prompt_text=prompt_row['prompt_text'],
-                    prompt_type=prompt_row['prompt_type'],
-                    status=prompt_row['status'],
-                    artifact_status=prompt_row['artifact_status'],
-                    output_reference=prompt_row['output_reference'],
-                    created_at=self._parse_datetime(prompt_row['created_at']),
-                    completed_at=self._parse_datetime(prompt_row['completed_at']) if prompt_row['completed_at'] else None,
-                    error_message=prompt_row['error_message'],
-                    writings=writings,
-                    # Legacy fields for backward compatibility
-                    writing_id=writings[0]['writing_id'] if writings else None,
-                    json_content=writings[0]['content'] if writings else None
-                )
-
-                results.append(record)
-
-            return results
+        # Show recent lyrics prompts with their statuses
+        logger.debug("Recent lyrics prompts:")
+        for r in conn.execute(_RECENT_LYRICS_SQL):
+            logger.debug(
+                "  - ID=%s, status='%s', artifact_status='%s', created=%s, text='%s...'",
+                r['id'], r['status'], r['artifact_status'], r['created_at'], r['prompt_text'][:50]
+            )
 
     def update_artifact_status(
         self,
@@ -292,30 +492,41 @@ class PromptRepository:
             status: New artifact_status ('pending', 'processing', 'ready', 'error')
             error_message: Optional error message (only used with 'error' status)
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.update_artifact_statuses([(prompt_id, status, error_message)])
 
-            if error_message:
-                cursor.execute("""
-                    UPDATE prompts
-                    SET artifact_status = ?, error_message = ?
-                    WHERE id = ?
-                """, (status, error_message, prompt_id))
-            else:
-                cursor.execute("""
-                    UPDATE prompts
-                    SET artifact_status = ?
-                    WHERE id = ?
-                """, (status, prompt_id))
+    def update_artifact_statuses(
+        self,
+        updates: List[Tuple[int, str, Optional[str]]]
+    ) -> None:
+        """Apply per-prompt status updates in one transaction
 
-            conn.commit()
+        Args:
+            updates: (prompt_id, status, error_message) tuples; a None or
+                empty error_message leaves the stored message unchanged
+        """
+        if not updates:
+            return
 
-            # Checkpoint WAL to ensure Docker containers can see changes
-            try:
-                cursor.execute("PRAGMA wal_checkpoint(PASSIVE)")
-            except sqlite3.Error:
-                # Non-critical operation - log but don't fail
-                pass
+        with self.get_connection() as conn:
+            # Take the write lock once for the whole batch
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                _UPDATE_STATUS_ERR_SQL,
+                [
+                    (status, error_message or None, prompt_id)
+                    for prompt_id, status, error_message in updates
+                ]
+            )
+            conn.execute("COMMIT")
+
+    def update_artifact_status_bulk(self, prompt_ids: List[int], status: str) -> None:
+        """Set the same artifact_status on many prompts in one transaction
+
+        Args:
+            prompt_ids: Prompt IDs to update
+            status: New artifact_status ('pending', 'processing', 'ready', 'error')
+        """
+        self.update_artifact_statuses([(prompt_id, status, None) for prompt_id in prompt_ids])
 
     def reset_stale_processing_prompts(self, timeout_minutes: int = 30) -> int:
         """
@@ -330,76 +541,62 @@ class PromptRepository:
             Number of prompts reset
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
             # Find prompts that have been processing for too long
-            # Use processed_at since that's when status was set to 'processing'
-            cursor.execute("""
-                UPDATE prompts
-                SET artifact_status = 'pending',
-                    error_message = 'Reset from stale processing state'
-                WHERE artifact_status = 'processing'
-                  AND processed_at IS NOT NULL
-                  AND processed_at < datetime('now', '-' || ? || ' minutes')
-            """, (timeout_minutes,))
-
-            count = cursor.rowcount
-            conn.commit()
+            params = (f'-{timeout_minutes} minutes',)
+            if _HAS_RETURNING:
+                # Count the rows actually reset rather than trusting rowcount
+                count = len(conn.execute(_RESET_STALE_SQL + "RETURNING id", params).fetchall())
+            else:
+                count = conn.execute(_RESET_STALE_SQL, params).rowcount
+
+            # Housekeeping path: refresh planner statistics if they're stale
+            conn.execute("PRAGMA optimize")
 
             return count
 
-    def _row_to_prompt_record(self, row: sqlite3.Row) -> PromptRecord:
-        """Convert database row to PromptRecord object
+    def _rows_to_prompt_records(self, rows: Iterable[tuple]) -> Iterator[PromptRecord]:
+        """Group joined prompt/writing rows into PromptRecords
+
+        Rows must arrive ordered by prompt (as the pending queries return
+        them), so each prompt's rows are contiguous and in writing_order.
 
         Args:
-            row: SQLite row from query
+            rows: Plain tuples of 9 prompt columns followed by (writing_id,
+                writing_order, content, content_type, title)
 
-        Returns:
-            PromptRecord with all fields populated
+        Yields:
+            PromptRecord per prompt with its writings populated
         """
-        return PromptRecord(
-            id=row['id'],
-            prompt_text=row['prompt_text'],
-            prompt_type=row['prompt_type'],
-            status=row['status'],
-            artifact_status=row['artifact_status'],
-            output_reference=row['output_reference'],
-            created_at=self._parse_datetime(row['created_at']),
-            completed_at=self._parse_datetime(row['completed_at']) if row['completed_at'] else None,
-            error_message=row['error_message'],
-            writing_id=row['writing_id'],
-            json_content=row['json_content']
-        )
-
-    def _parse_datetime(self, dt_str: str) -> datetime:
-        """Parse datetime string from database
-
-        Handles various datetime formats from SQLite.
+        for _, group in groupby(rows, key=itemgetter(0)):
+            group = list(group)
+            writings = [
+                Writing._make(row[9:])
+                for row in group
+                # NULL writing id: no writing, or one of another content_type
+                if row[9] is not None
+            ]
+            yield self._row_to_prompt_record(group[0][:9], writings)
+
+    def _row_to_prompt_record(self, row: tuple, writings: List[Writing]) -> PromptRecord:
+        """Convert a pending-prompt row and its writings to a PromptRecord
+
+        The pending queries select the prompt columns in PromptRecord field
+        order (id through error_message), so the row binds positionally.
 
         Args:
-            dt_str: Datetime string
+            row: Plain tuple of the 9 prompt columns, in PromptRecord field order
+            writings: Writings for this prompt, in writing_order
 
         Returns:
-            datetime object
+            PromptRecord with all fields populated
         """
-        # Try ISO format first
-        try:
-            return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        except ValueError:
-            pass
-
-        # Try common SQLite format
-        try:
-            return datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            pass
-
-        # Fallback: try with milliseconds
-        try:
-            return datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S.%f')
-        except ValueError:
-            # Last resort: return current time
-            return datetime.now()
+        return PromptRecord(
+            *row,
+            writings=writings,
+            # Legacy fields for backward compatibility
+            writing_id=writings[0].writing_id if writings else None,
+            json_content=writings[0].content if writings else None
+        )
 
 
 class ArtifactRepository:
@@ -412,22 +609,25 @@ class ArtifactRepository:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        ensure_db_initialized(db_path)
+
+    def get_connection(self):
+        """Borrow a pooled database connection
 
-    def get_connection(self) -> sqlite3.Connection:
-        """Create database connection with row factory and WAL mode
+        Use as a context manager: ``with repo.get_connection() as conn:``
 
         Returns:
-            SQLite connection with row factory configured
+            Context manager yielding a SQLite connection with row factory configured
         """
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row
+        return pooled_connection(self.db_path)
 
-        # Enable WAL mode for concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA busy_timeout=30000")
+    def get_read_connection(self):
+        """Borrow a pooled read-only database connection (for queries)
 
-        return conn
+        Returns:
+            Context manager yielding a read-only SQLite connection
+        """
+        return pooled_connection(self.db_path, readonly=True)
 
     def save_artifact(self, artifact: ArtifactRecord) -> int:
         """Insert artifact record into database
@@ -439,42 +639,20 @@ class ArtifactRepository:
             ID of inserted artifact record
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO prompt_artifacts (
-                    prompt_id,
-                    artifact_type,
-                    file_path,
-                    preview_path,
-                    metadata,
-                    created_at,
-                    updated_at
-                ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            """, (
+            return conn.execute(_INSERT_ARTIFACT_SQL, (
                 artifact.prompt_id,
                 artifact.artifact_type,
                 artifact.file_path,
                 artifact.preview_path,
-                json.dumps(artifact.metadata)
-            ))
-
-            conn.commit()
-
-            # Checkpoint WAL to ensure Docker containers can see changes
-            try:
-                cursor.execute("PRAGMA wal_checkpoint(PASSIVE)")
-            except sqlite3.Error:
-                # Non-critical operation - log but don't fail
-                pass
-
-            return cursor.lastrowid
+                json_dumps(artifact.metadata)
+            )).lastrowid
 
     def save_artifacts_atomic(
         self,
         prompt_id: int,
         artifacts: List[ArtifactRecord],
-        final_status: str = 'ready'
+        final_status: str = 'ready',
+        checkpoint: bool = True
     ):
         """
         Atomically save all artifacts and update prompt status.
@@ -485,49 +663,41 @@ class ArtifactRepository:
             prompt_id: Prompt ID
             artifacts: List of ArtifactRecord objects to save
             final_status: Final artifact_status ('ready' or 'error')
+            checkpoint: Run a PASSIVE WAL checkpoint after the commit; pass
+                False when the caller checkpoints once after a whole batch
 
         Raises:
             Exception if transaction fails (will trigger rollback)
         """
-        from db_utils import db_transaction
-        import json
+        # Serialize all metadata up front, outside the write transaction
+        rows = [
+            (
+                artifact.prompt_id,
+                artifact.artifact_type,
+                artifact.file_path,
+                artifact.preview_path,
+                json_dumps(artifact.metadata) if artifact.metadata else None
+            )
+            for artifact in artifacts
+        ]
 
-        with db_transaction(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
 
             # Step 1: Insert all artifacts
-            for artifact in artifacts:
-                cursor.execute("""
-                    INSERT INTO prompt_artifacts (
-                        prompt_id,
-                        artifact_type,
-                        file_path,
-                        preview_path,
-                        metadata,
-                        created_at,
-                        updated_at
-                    ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """, (
-                    artifact.prompt_id,
-                    artifact.artifact_type,
-                    artifact.file_path,
-                    artifact.preview_path,
-                    json.dumps(artifact.metadata) if artifact.metadata else None
-                ))
+            conn.executemany(_INSERT_ARTIFACT_SQL, rows)
 
             # Step 2: Update status to final state
-            cursor.execute("""
-                UPDATE prompts
-                SET artifact_status = ?
-                WHERE id = ?
-            """, (final_status, prompt_id))
+            conn.execute(_UPDATE_STATUS_SQL, (final_status, prompt_id))
 
-            # All operations succeed together (auto-commits)
-            # Or all fail together (auto-rollback)
+            # All operations succeed together (commit)
+            # Or all fail together (the with-block rolls back)
+            conn.execute("COMMIT")
 
-        # Checkpoint after successful transaction
-        from db_utils import force_wal_checkpoint
-        force_wal_checkpoint(self.db_path, mode="RESTART")
+        # Non-blocking checkpoint so containers reading only the main
+        # database file pick up the artifacts; never waits on readers
+        if checkpoint:
+            force_wal_checkpoint(self.db_path, mode="PASSIVE")
 
     def get_artifacts_for_prompt(self, prompt_id: int) -> List[ArtifactRecord]:
         """Get all artifacts for a specific prompt
@@ -538,61 +708,40 @@ class ArtifactRepository:
         Returns:
             List of ArtifactRecord objects
         """
-        query = """
-        SELECT
-            id,
-            prompt_id,
-            artifact_type,
-            file_path,
-            preview_path,
-            metadata,
-            created_at
-        FROM prompt_artifacts
-        WHERE prompt_id = ?
-        ORDER BY created_at DESC
-        """
-
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query, (prompt_id,))
+            cursor.row_factory = None
+            cursor.execute(_ARTIFACTS_FOR_PROMPT_SQL, (prompt_id,))
             rows = cursor.fetchall()
 
             return [self._row_to_artifact_record(row) for row in rows]
 
-    def _row_to_artifact_record(self, row: sqlite3.Row) -> ArtifactRecord:
+    def _row_to_artifact_record(self, row: tuple) -> ArtifactRecord:
         """Convert database row to ArtifactRecord object
 
         Args:
-            row: SQLite row from query
+            row: Plain tuple in artifact query column order
 
         Returns:
             ArtifactRecord with all fields populated
         """
+        (artifact_id, prompt_id, artifact_type, file_path,
+         preview_path, raw_metadata, created_at) = row
+
         # Parse metadata JSON
         metadata = {}
-        if row['metadata']:
+        if raw_metadata:
             try:
-                metadata = json.loads(row['metadata'])
+                metadata = json_loads(raw_metadata)
             except json.JSONDecodeError:
                 metadata = {}
 
-        # Parse created_at
-        created_at = None
-        if row['created_at']:
-            try:
-                created_at = datetime.fromisoformat(row['created_at'].replace('Z', '+00:00'))
-            except ValueError:
-                try:
-                    created_at = datetime.strptime(row['created_at'], '%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    created_at = datetime.now()
-
         return ArtifactRecord(
-            id=row['id'],
-            prompt_id=row['prompt_id'],
-            artifact_type=row['artifact_type'],
-            file_path=row['file_path'],
-            preview_path=row['preview_path'],
+            id=artifact_id,
+            prompt_id=prompt_id,
+            artifact_type=artifact_type,
+            file_path=file_path,
+            preview_path=preview_path,
             metadata=metadata,
             created_at=created_at
         )
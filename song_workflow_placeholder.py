@@ -7,75 +7,20 @@ provides the actual ComfyUI-to-Python song generation workflow script.
 
 Expected usage:
     python song_workflow_placeholder.py --lyrics_text "..." --output /path/to/output --queue-size 1
+
+Arguments are accepted but ignored: the script always fails immediately,
+writing a short reason to stderr (which the executor records as the error).
 """
 
-import argparse
 import sys
-import os
-from pathlib import Path
 
 
 def main():
     """Main entry point for placeholder script"""
-
-    parser = argparse.ArgumentParser(
-        description='Placeholder for song workflow script'
-    )
-
-    parser.add_argument(
-        '--lyrics_text',
-        type=str,
-        required=True,
-        help='Full lyrics text with section markers'
-    )
-
-    parser.add_argument(
-        '--output',
-        type=str,
-        required=True,
-        help='Output directory for generated audio files'
+    sys.stderr.write(
+        "ERROR: song workflow not implemented - replace song_workflow_placeholder.py "
+        "with the exported ComfyUI song workflow script\n"
     )
-
-    parser.add_argument(
-        '--queue-size',
-        type=int,
-        default=1,
-        help='Queue size (not used in placeholder)'
-    )
-
-    args = parser.parse_args()
-
-    # Display what would happen
-    print("=" * 70)
-    print("SONG WORKFLOW PLACEHOLDER")
-    print("=" * 70)
-    print()
-    print("This is a placeholder script. The actual song workflow script")
-    print("has not yet been provided by the user.")
-    print()
-    print("Would generate song with the following parameters:")
-    print()
-    print(f"Lyrics text (first 200 chars):")
-    print(f"  {args.lyrics_text[:200]}...")
-    print()
-    print(f"Output directory:")
-    print(f"  {args.output}")
-    print()
-    print(f"Queue size:")
-    print(f"  {args.queue_size}")
-    print()
-    print("=" * 70)
-    print()
-    print("ERROR: Actual song workflow script not yet provided by user")
-    print()
-    print("To fix this:")
-    print("1. Obtain the ComfyUI-to-Python exported song workflow script")
-    print("2. Replace this placeholder file with the actual script")
-    print("3. Update media_generator_config.json if needed")
-    print()
-    print("=" * 70)
-
-    # Exit with error
     sys.exit(1)
 
 
@@ -5,10 +5,33 @@ Contains ImageGallery and AudioPlayer widgets
 
 import tkinter as tk
 from tkinter import ttk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import json
+import os
 import subprocess
 import sys
 
+# Optional: image display (gallery shows an error message without Pillow)
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = ImageTk = None
+
+# Optional: faster bilinear previews while the gallery is being resized
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
+# Optional: in-app audio playback (falls back to the system player)
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
 # Solarpunk color palette (imported from main app)
 COLORS = {
     'bg_primary': '#4A7C59',    # Deep Forest Green
@@ -23,15 +46,112 @@ COLORS = {
     'error': '#CD5C5C',         # Indian Red
 }
 
+# Prompt IDs per IN (...) query, below SQLite's 999 bound-variable limit
+_SQL_IN_BATCH = 900
+
+
+def _scan_media_files(media_dir, extensions):
+    """List media files in the per-prompt subdirectories of media_dir, newest first
+
+    Uses os.scandir so directories are listed once and each file's mtime
+    comes from its DirEntry (cached stat) rather than a separate stat()
+    per sort-key lookup.
+
+    Args:
+        media_dir: Directory containing {prompt_id}_{timestamp} subdirectories
+        extensions: Tuple of lowercase filename suffixes to include
+
+    Returns:
+        Tuple of (paths, mtimes): Path objects sorted by modification time
+        (newest first) and their st_mtime_ns values in the same order
+    """
+    found = []
+    with os.scandir(media_dir) as subdirs:
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+            with os.scandir(subdir.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(extensions) and entry.is_file():
+                        found.append((entry.stat().st_mtime_ns, entry.path))
+
+    found.sort(reverse=True)
+    return [Path(path) for _, path in found], [mtime for mtime, _ in found]
+
+
+def _fit_size(orig_width, orig_height, canvas_width, canvas_height):
+    """Scale image dimensions to fit the canvas, keeping aspect ratio
+
+    Args:
+        orig_width: Image width in pixels
+        orig_height: Image height in pixels
+        canvas_width: Canvas width in pixels
+        canvas_height: Canvas height in pixels
+
+    Returns:
+        Tuple of (width, height) including 10px padding on each side
+    """
+    img_ratio = orig_width / orig_height
+    canvas_ratio = canvas_width / canvas_height
+
+    if img_ratio > canvas_ratio:
+        # Image is wider than canvas - width-constrained
+        new_width = canvas_width - 20  # Padding
+        new_height = int(new_width / img_ratio)
+    else:
+        # Image is taller than canvas - height-constrained
+        new_height = canvas_height - 20  # Padding
+        new_width = int(new_height * img_ratio)
+
+    return new_width, new_height
+
+
+def _to_display_mode(img):
+    """Flatten transparency onto white and convert to a mode Tk takes as-is
+
+    Args:
+        img: Scaled PIL Image
+
+    Returns:
+        RGB or L PIL Image
+    """
+    # Flatten transparency onto white (handle PNG transparency);
+    # RGB and L images need no composite
+    if img.mode in ('RGBA', 'LA'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode not in ('RGB', 'L'):
+        # CMYK, 16-bit, bilevel etc.: convert here rather than inside
+        # ImageTk.PhotoImage (on the Tk thread)
+        return img.convert('RGB')
+    return img
+
 
 class ImageGallery:
     """Image gallery with file list and single full-size image viewer"""
 
+    # Decoded images kept for redraws (resizes, reselecting a recent file)
+    DECODED_CACHE_SIZE = 4
+    # Scaled PhotoImages kept for revisiting a file at the same canvas size
+    PHOTO_CACHE_SIZE = 8
+
     def __init__(self, parent, output_dir):
         self.output_dir = output_dir
         self.image_files = []
         self.current_photo = None
         self.current_image_path = None
+        self._current_file_key = None  # (path, mtime_ns) of the displayed image
+        self._last_sig = None  # (count, newest mtime_ns) of the listed files
+        self._resize_after_id = None  # Pending debounced redraw
+        self._last_canvas_wh = None  # Canvas size of the last <Configure>
+        self._decoded_cache = OrderedDict()  # (path, mtime_ns) -> (image, original size)
+        self._photo_cache = OrderedDict()  # (path, mtime_ns, canvas w, h) -> (photo, image, w, h)
+        self._current_scaled = None  # Scaled PIL image behind the drawn photo (preview source)
+        # Decode/resize runs off the Tk thread; one worker so the decoded
+        # cache has a single writer, and queued stale requests are skipped
+        self._decode_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gallery')
+        self._display_generation = 0  # Bumped per request; older results are dropped
 
         # Main frame (horizontal split)
         self.frame = tk.Frame(parent, bg=COLORS['bg_panel'])
@@ -85,6 +205,12 @@ class ImageGallery:
         )
         self.image_canvas.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+        # Persistent canvas items, updated in place on every redraw
+        self._canvas_image = self.image_canvas.create_image(0, 0, anchor='nw')
+        self._canvas_text = self.image_canvas.create_text(
+            0, 0, justify=tk.CENTER, state=tk.HIDDEN
+        )
+
         # Bind resize to redraw image
         self.image_canvas.bind('<Configure>', self._on_canvas_resize)
 
@@ -92,10 +218,70 @@ class ImageGallery:
         self.image_canvas.bind('<Double-Button-1>', self._on_double_click)
 
     def _on_canvas_resize(self, event):
-        """Redraw image when canvas is resized"""
+        """Redraw image when canvas is resized (debounced)"""
+        # Configure also fires for non-geometry changes; skip same-size events
+        canvas_wh = (event.width, event.height)
+        if canvas_wh == self._last_canvas_wh:
+            return
+        self._last_canvas_wh = canvas_wh
+
+        # Keep any message centered
+        self.image_canvas.coords(self._canvas_text, event.width // 2, event.height // 2)
+
         if self.current_image_path:
-            # Defer redraw slightly to avoid excessive redraws during resize
-            self.image_canvas.after(100, lambda: self.display_image(self.current_image_path))
+            # Restart the timer on every event so only one redraw runs
+            # once the user stops resizing
+            if self._resize_after_id is not None:
+                self.image_canvas.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.image_canvas.after(150, self._redraw_after_resize)
+
+            # Meanwhile show a cheap bilinear scale of the decoded image
+            self._draw_resize_preview(event.width, event.height)
+
+    def _draw_resize_preview(self, canvas_width, canvas_height):
+        """Draw a fast, lower-quality scale of the current image
+
+        Used while the canvas is being resized; the debounced redraw then
+        replaces it with the Lanczos-filtered image. Scales the displayed
+        (already canvas-sized) image rather than the full decode, so each
+        <Configure> stays cheap on the Tk thread. Skipped while the
+        selected image is still decoding.
+
+        Args:
+            canvas_width: New canvas width in pixels
+            canvas_height: New canvas height in pixels
+        """
+        # The drawn image must be the selected one (not one still decoding)
+        file_key = self._current_file_key
+        if file_key is None or file_key[0] != str(self.current_image_path):
+            return
+        img = self._current_scaled
+        if img is None or canvas_width <= 1 or canvas_height <= 1:
+            return
+
+        new_width, new_height = _fit_size(img.width, img.height, canvas_width, canvas_height)
+        if new_width < 1 or new_height < 1:
+            return
+
+        try:
+            # Source is already flattened to RGB or L by _to_display_mode
+            if cv2 is not None:
+                preview = Image.fromarray(cv2.resize(
+                    np.asarray(img), (new_width, new_height), interpolation=cv2.INTER_LINEAR
+                ))
+            else:
+                preview = img.resize((new_width, new_height), Image.Resampling.BILINEAR)
+
+            self.current_photo = ImageTk.PhotoImage(preview)
+            self._draw_photo(new_width, new_height, canvas_width, canvas_height)
+        except Exception as e:
+            print(f"Failed to draw resize preview: {e}")
+
+    def _redraw_after_resize(self):
+        """Debounced resize callback: redraw the current image"""
+        self._resize_after_id = None
+        if self.current_image_path:
+            self.display_image(self.current_image_path)
 
     def _on_double_click(self, event):
         """Open current image in system viewer on double-click"""
@@ -103,51 +289,79 @@ class ImageGallery:
             self._view_full_image(self.current_image_path)
 
     def load_images(self):
-        """Load image list from output directory"""
-        # Clear existing
-        self.file_listbox.delete(0, tk.END)
-        self.image_files.clear()
-        self.current_photo = None
-        self.current_image_path = None
+        """Load image list from output directory
 
+        Refreshing with no new files leaves the listbox untouched; files
+        added since the last load are prepended, keeping scroll position
+        and selection.
+        """
         # Find all image files in output_dir/image/
         image_dir = Path(self.output_dir) / 'image'
-        if not image_dir.exists():
+        image_files, mtimes = [], []
+        if image_dir.exists():
+            # Sorted by modification time (newest first)
+            image_files, mtimes = _scan_media_files(image_dir, ('.png', '.jpg', '.jpeg'))
+
+        if not image_files:
+            self._clear_images()
             self._show_no_images_message()
             return
 
-        image_files = []
-        for subdir in image_dir.iterdir():
-            if subdir.is_dir():
-                image_files.extend(subdir.glob('*.png'))
-                image_files.extend(subdir.glob('*.jpg'))
-                image_files.extend(subdir.glob('*.jpeg'))
+        # Nothing new since the last load (mtimes come from the scan itself)
+        sig = (len(image_files), mtimes[0])
+        if sig == self._last_sig:
+            return
 
-        if not image_files:
-            self._show_no_images_message()
+        # Only new files at the top: insert just those rows
+        added = len(image_files) - len(self.image_files)
+        if self.image_files and added > 0 and image_files[added:] == self.image_files:
+            self.file_listbox.insert(0, *map(self._display_text, image_files[:added]))
+            self.image_files = image_files
+            self._last_sig = sig
             return
 
-        # Sort by modification time (newest first)
-        image_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        # Otherwise rebuild the list
+        self._clear_images()
 
-        # Store files and populate listbox
+        # Store files and populate listbox (one Tk call for all rows)
         self.image_files = image_files
-        for img_path in image_files:
-            # Extract prompt number from parent directory name
-            # Path structure: output_dir/image/{prompt_id}_{timestamp}/output.png
-            # Example: 219_20260109T150634
-            dir_name = img_path.parent.name
+        self._last_sig = sig
+        self.file_listbox.insert(tk.END, *map(self._display_text, image_files))
 
-            # Extract just the prompt ID (before the first underscore)
-            prompt_id = dir_name.split('_')[0] if '_' in dir_name else dir_name
+        # Auto-select first image
+        self.file_listbox.selection_set(0)
+        self.on_file_select(None)
 
-            display_text = f"Prompt #{prompt_id}"
-            self.file_listbox.insert(tk.END, display_text)
+    def _clear_images(self):
+        """Empty the file list and forget the displayed image"""
+        self.file_listbox.delete(0, tk.END)
+        self.image_files = []
+        self.current_photo = None
+        self.current_image_path = None
+        self._current_file_key = None
+        self._current_scaled = None
+        self._display_generation += 1
+        self._last_sig = None
 
-        # Auto-select first image
-        if self.image_files:
-            self.file_listbox.selection_set(0)
-            self.on_file_select(None)
+    @staticmethod
+    def _display_text(img_path):
+        """Listbox label for an image file
+
+        Args:
+            img_path: Path to the image file
+
+        Returns:
+            Display string, e.g. "Prompt #219"
+        """
+        # Extract prompt number from parent directory name
+        # Path structure: output_dir/image/{prompt_id}_{timestamp}/output.png
+        # Example: 219_20260109T150634
+        dir_name = img_path.parent.name
+
+        # Extract just the prompt ID (before the first underscore)
+        prompt_id = dir_name.partition('_')[0]
+
+        return f"Prompt #{prompt_id}"
 
     def on_file_select(self, event):
         """Handle file selection from listbox"""
@@ -163,22 +377,16 @@ class ImageGallery:
         self.display_image(image_path)
 
     def display_image(self, image_path):
-        """Display single image scaled to fit canvas while maintaining aspect ratio"""
-        try:
-            from PIL import Image, ImageTk
-
-            # Load original image
-            img = Image.open(image_path)
+        """Display single image scaled to fit canvas while maintaining aspect ratio
 
-            # Convert to RGB if needed (handle PNG transparency)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                if img.mode in ('RGBA', 'LA'):
-                    background.paste(img, mask=img.split()[-1])
-                    img = background
+        Cached renders are drawn immediately; otherwise decoding and
+        resizing run on a worker thread and the result is drawn from the
+        Tk thread when ready (unless a newer image was requested meanwhile).
+        """
+        self._display_generation += 1
+        generation = self._display_generation
 
+        try:
             # Get canvas dimensions
             self.image_canvas.update_idletasks()
             canvas_width = self.image_canvas.winfo_width()
@@ -190,38 +398,185 @@ class ImageGallery:
             if canvas_height <= 1:
                 canvas_height = 600
 
-            # Calculate scaling to fit canvas (maintain aspect ratio)
-            img_ratio = img.width / img.height
-            canvas_ratio = canvas_width / canvas_height
+            # Store current path for resize and double-click
+            self.current_image_path = image_path
 
-            if img_ratio > canvas_ratio:
-                # Image is wider than canvas - width-constrained
-                new_width = canvas_width - 20  # Padding
-                new_height = int(new_width / img_ratio)
-            else:
-                # Image is taller than canvas - height-constrained
-                new_height = canvas_height - 20  # Padding
-                new_width = int(new_height * img_ratio)
+            # Revisiting a file at the same canvas size reuses its PhotoImage
+            file_key = (str(image_path), os.stat(image_path).st_mtime_ns)
+            photo_key = file_key + (canvas_width, canvas_height)
+            cached_photo = self._photo_cache.get(photo_key)
+            if cached_photo is not None:
+                self._photo_cache.move_to_end(photo_key)
+                self._show_photo(cached_photo, file_key, canvas_width, canvas_height)
+                return
+
+            future = self._decode_pool.submit(
+                self._prepare_image, generation, image_path, file_key, canvas_width, canvas_height
+            )
+            # Runs on the worker thread; hand the result to the Tk thread
+            future.add_done_callback(
+                lambda done: self.frame.after(
+                    0, self._finish_display, generation, done,
+                    image_path, file_key, canvas_width, canvas_height
+                )
+            )
 
-            # Resize image
-            img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            self.current_photo = ImageTk.PhotoImage(img_resized)
+        except Exception as e:
+            print(f"Failed to display image {image_path}: {e}")
+            self._show_error_message(str(e))
 
-            # Center on canvas
-            x = (canvas_width - new_width) // 2
-            y = (canvas_height - new_height) // 2
+    def _finish_display(self, generation, future, image_path, file_key,
+                        canvas_width, canvas_height):
+        """Turn a worker's resized image into a PhotoImage and draw it (Tk thread)
+
+        Args:
+            generation: Display request the result belongs to
+            future: Completed future from _prepare_image
+            image_path: Image file that was rendered
+            file_key: (path, mtime_ns) of the image
+            canvas_width: Canvas width the image was scaled for
+            canvas_height: Canvas height the image was scaled for
+        """
+        if generation != self._display_generation:
+            return
 
-            # Clear and draw
-            self.image_canvas.delete('all')
-            self.image_canvas.create_image(x, y, anchor='nw', image=self.current_photo)
+        try:
+            img_resized, new_width, new_height = future.result()
 
-            # Store current path for resize and double-click
-            self.current_image_path = image_path
+            cached_photo = (ImageTk.PhotoImage(img_resized), img_resized, new_width, new_height)
+            self._photo_cache[file_key + (canvas_width, canvas_height)] = cached_photo
+            if len(self._photo_cache) > self.PHOTO_CACHE_SIZE:
+                self._photo_cache.popitem(last=False)
+
+            self._show_photo(cached_photo, file_key, canvas_width, canvas_height)
 
         except Exception as e:
             print(f"Failed to display image {image_path}: {e}")
             self._show_error_message(str(e))
 
+    def _show_photo(self, cached_photo, file_key, canvas_width, canvas_height):
+        """Make a rendered photo the current image and draw it
+
+        Args:
+            cached_photo: (PhotoImage, scaled PIL image, width, height) tuple
+            file_key: (path, mtime_ns) of the image
+            canvas_width: Canvas width the photo was scaled for
+            canvas_height: Canvas height the photo was scaled for
+        """
+        # Keep a reference: Tk only holds the PhotoImage by name
+        self.current_photo, self._current_scaled, new_width, new_height = cached_photo
+        self._current_file_key = file_key
+        self._draw_photo(new_width, new_height, canvas_width, canvas_height)
+
+    def _draw_photo(self, width, height, canvas_width, canvas_height):
+        """Draw self.current_photo centered on the canvas
+
+        Args:
+            width: Photo width in pixels
+            height: Photo height in pixels
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+        """
+        # Center on canvas
+        x = (canvas_width - width) // 2
+        y = (canvas_height - height) // 2
+
+        # Swap the photo on the existing item (Tk only redraws what changed)
+        self.image_canvas.coords(self._canvas_image, x, y)
+        self.image_canvas.itemconfig(self._canvas_image, image=self.current_photo, state=tk.NORMAL)
+        self.image_canvas.itemconfig(self._canvas_text, state=tk.HIDDEN)
+
+    def _prepare_image(self, generation, image_path, file_key, canvas_width, canvas_height):
+        """Decode (or reuse) and scale an image for the canvas (worker thread)
+
+        Args:
+            generation: Display request this work belongs to
+            image_path: Image file to render
+            file_key: (path, mtime_ns) key for the decoded-image cache
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+
+        Returns:
+            Tuple of (RGB or L PIL Image, width, height), or None if a newer
+            image was requested before this one started (the result is
+            then discarded unread)
+        """
+        if generation != self._display_generation:
+            return None
+
+        if Image is None:
+            raise ImportError("Pillow is required to display images")
+
+        # Reuse the decoded image while the file is unchanged
+        cached = self._decoded_cache.get(file_key)
+        if cached is not None:
+            img, (orig_width, orig_height) = cached
+        else:
+            # Open original image (size is known before pixels are decoded)
+            img = Image.open(image_path)
+            orig_width, orig_height = img.size
+
+        new_width, new_height = _fit_size(orig_width, orig_height, canvas_width, canvas_height)
+
+        # A draft-decoded cache entry may be too small after the canvas grew
+        draft_size = (new_width * 2, new_height * 2)
+        if cached is not None and (
+            img.width < min(orig_width, draft_size[0])
+            or img.height < min(orig_height, draft_size[1])
+        ):
+            cached = None
+            img = Image.open(image_path)
+
+        if cached is None:
+            img = self._decode_image(img, draft_size)
+            self._decoded_cache[file_key] = (img, (orig_width, orig_height))
+            if len(self._decoded_cache) > self.DECODED_CACHE_SIZE:
+                self._decoded_cache.popitem(last=False)
+        else:
+            self._decoded_cache.move_to_end(file_key)
+
+        # Resize image; reducing_gap lets Pillow box-reduce large downscales
+        # first, leaving Lanczos at least a 2x reduction of a smaller image.
+        # (Not thumbnail(): that resizes in place and would shrink the
+        # cached decoded image.)
+        img_resized = img.resize(
+            (new_width, new_height),
+            Image.Resampling.LANCZOS,
+            reducing_gap=2.0
+        )
+
+        return _to_display_mode(img_resized), new_width, new_height
+
+    def _decode_image(self, img, draft_size):
+        """Decode an opened image, at reduced scale where the format allows
+
+        Transparency is kept (RGBA/LA); it is flattened onto white only
+        after the downscale, where the composite touches far fewer pixels.
+
+        Args:
+            img: PIL Image from Image.open (not yet loaded)
+            draft_size: Smallest (width, height) the decoded image may have
+
+        Returns:
+            Loaded PIL Image (RGB, L, RGBA or LA for the common formats)
+        """
+        # JPEGs can decode at 1/2..1/8 scale; keep at least 2x the target
+        img.draft('RGB', draft_size)
+
+        # Palette images only need an alpha channel if they have transparency
+        if img.mode == 'P':
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+
+        # Read pixels now so the cached image doesn't keep the file open
+        img.load()
+
+        # 16-bit grayscale: Image.reduce (used via reducing_gap) rejects the
+        # I;16 modes, and a plain convert would clip everything above 255
+        if img.mode.startswith('I;16'):
+            img = img.convert('I').point(lambda value: value * (1 / 256)).convert('L')
+
+        return img
+
     def _view_full_image(self, image_path):
         """Open image in system viewer"""
         try:
@@ -237,24 +592,35 @@ class ImageGallery:
     def _show_no_images_message(self):
         """Display message when no images found"""
         self.file_listbox.insert(tk.END, "(no images yet)")
-        self.image_canvas.delete('all')
-        self.image_canvas.create_text(
-            400, 300,
-            text="No generated images yet.\nGenerate some prompts to see them here!",
-            fill=COLORS['text_primary'],
-            font=('Helvetica Neue', 14),
-            justify=tk.CENTER
+        self._show_canvas_message(
+            "No generated images yet.\nGenerate some prompts to see them here!",
+            COLORS['text_primary'],
+            ('Helvetica Neue', 14)
         )
 
     def _show_error_message(self, error_msg):
         """Display error message on canvas"""
-        self.image_canvas.delete('all')
-        self.image_canvas.create_text(
-            400, 300,
-            text=f"Failed to load image\n{error_msg}",
-            fill=COLORS['error'],
-            font=('Helvetica Neue', 12),
-            justify=tk.CENTER
+        self._show_canvas_message(
+            f"Failed to load image\n{error_msg}",
+            COLORS['error'],
+            ('Helvetica Neue', 12)
+        )
+
+    def _show_canvas_message(self, text, fill, font):
+        """Hide the image and show a text message on the canvas
+
+        Args:
+            text: Message text
+            fill: Text color
+            font: Tk font tuple
+        """
+        # Center using the last <Configure> size (800x600 before the first one)
+        canvas_width, canvas_height = self._last_canvas_wh or (800, 600)
+
+        self.image_canvas.itemconfig(self._canvas_image, image='', state=tk.HIDDEN)
+        self.image_canvas.coords(self._canvas_text, canvas_width // 2, canvas_height // 2)
+        self.image_canvas.itemconfig(
+            self._canvas_text, text=text, fill=fill, font=font, state=tk.NORMAL
         )
 
 
@@ -269,6 +635,8 @@ class AudioPlayer:
         self.audio_files = []
         self.audio_backend = None
         self.audio_duration_ms = 0
+        self._playback_after_id = None  # Pending position-label refresh
+        self._last_displayed_second = None
 
         # Main container (horizontal split)
         self.frame = tk.Frame(parent, bg=COLORS['bg_panel'])
@@ -373,122 +741,128 @@ class AudioPlayer:
 
     def _init_audio_backend(self):
         """Initialize audio playback backend"""
-        try:
-            import pygame
+        if pygame is not None:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
             self.audio_backend = 'pygame'
-        except ImportError:
+        else:
             # Fallback: use system command
             self.audio_backend = 'system'
             print("pygame not available, using system command for audio playback")
 
     def load_playlist(self):
         """Load audio files from output directory with metadata"""
-        # Clear existing
-        for item in self.playlist.get_children():
-            self.playlist.delete(item)
+        # Clear existing (one Tk call for all rows)
+        self.playlist.delete(*self.playlist.get_children())
         self.audio_files.clear()
 
         audio_dir = Path(self.output_dir) / 'audio'
         if not audio_dir.exists():
             return
 
-        audio_files = []
-        for subdir in audio_dir.iterdir():
-            if subdir.is_dir():
-                audio_files.extend(subdir.glob('*.wav'))
-                audio_files.extend(subdir.glob('*.mp3'))
-                audio_files.extend(subdir.glob('*.flac'))
+        # Sorted by modification time (newest first)
+        audio_files, _ = _scan_media_files(audio_dir, ('.wav', '.mp3', '.flac'))
 
         if not audio_files:
             return
 
-        # Sort by modification time (newest first)
-        audio_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-
-        # Store files and populate treeview
-        self.audio_files = audio_files
-        for audio_file in audio_files:
-            # Extract prompt number from parent directory name
-            # Path structure: output_dir/audio/{prompt_id}_{timestamp}/output.wav
-            # Example: 219_20260109T150634
-            dir_name = audio_file.parent.name
-            filename = audio_file.name
+        # Extract prompt number from parent directory name
+        # Path structure: output_dir/audio/{prompt_id}_{timestamp}/output.wav
+        # Example: 219_20260109T150634
+        # (just the prompt ID, before the first underscore)
+        prompt_ids = [audio_file.parent.name.partition('_')[0] for audio_file in audio_files]
 
-            # Extract just the prompt ID (before the first underscore)
-            prompt_id = dir_name.split('_')[0] if '_' in dir_name else dir_name
+        # Fetch all song titles from database in one pass
+        song_titles = {}
+        if self.prompt_repo:
+            try:
+                song_titles = self._fetch_song_titles(
+                    {int(prompt_id) for prompt_id in prompt_ids if prompt_id.isdigit()}
+                )
+            except Exception as e:
+                print(f"Failed to fetch song titles: {e}")
+                import traceback
+                traceback.print_exc()
 
-            # Fetch song title from database
+        # Build every row first, then do the Tk inserts back to back
+        rows = []
+        for audio_file, prompt_id in zip(audio_files, prompt_ids):
             song_title = "(Unknown)"
-            if self.prompt_repo:
+            if prompt_id.isdigit():
+                song_title = song_titles.get(int(prompt_id), song_title)
+            rows.append((f"#{prompt_id}", audio_file.name, song_title))
+
+        # Store files and populate treeview
+        self.audio_files = audio_files
+        for values in rows:
+            self.playlist.insert('', 'end', values=values)
+
+    def _fetch_song_titles(self, prompt_ids):
+        """Look up song titles for many prompts with batched IN (...) queries
+
+        Prefers the legacy output_reference writing and falls back to the
+        first linked writing (junction table) for prompts without one.
+        Supports both 'lyrics_prompt' (new JSON) and 'song_prompt' (old plain text).
+
+        Args:
+            prompt_ids: Set of prompt IDs
+
+        Returns:
+            Dict mapping prompt ID to song title (missing if no record found)
+        """
+        rows = {}
+        ids = sorted(prompt_ids)
+
+        # One pooled read-only connection for every batch
+        with self.prompt_repo.get_read_connection() as conn:
+            for start in range(0, len(ids), _SQL_IN_BATCH):
+                batch = ids[start:start + _SQL_IN_BATCH]
+                placeholders = ', '.join('?' * len(batch))
+
+                # First try output_reference (legacy single writing link)
+                for prompt_id, content, content_type, db_title in conn.execute(
+                    f"""SELECT p.id, w.content, w.content_type, w.title
+                        FROM prompts p
+                        INNER JOIN writings w ON p.output_reference = w.id
+                        WHERE p.id IN ({placeholders})
+                          AND w.content_type IN ('lyrics_prompt', 'song_prompt')""",
+                    batch
+                ):
+                    rows[prompt_id] = (content, content_type, db_title)
+
+                # Then the junction table (newer multi-writing support);
+                # ascending writing_order, so setdefault keeps the first one
+                for prompt_id, content, content_type, db_title in conn.execute(
+                    f"""SELECT pw.prompt_id, w.content, w.content_type, w.title
+                        FROM prompt_writings pw
+                        INNER JOIN writings w ON pw.writing_id = w.id
+                        WHERE pw.prompt_id IN ({placeholders})
+                          AND w.content_type IN ('lyrics_prompt', 'song_prompt')
+                        ORDER BY pw.prompt_id, pw.writing_order ASC""",
+                    batch
+                ):
+                    rows.setdefault(prompt_id, (content, content_type, db_title))
+
+        titles = {}
+        for prompt_id, (content, content_type, db_title) in rows.items():
+            # Handle new JSON format (lyrics_prompt)
+            if content_type == 'lyrics_prompt':
+                # Per-row guard: NULL or non-object content must not sink the batch
                 try:
-                    import json
-
-                    # Query directly from database by ID
-                    try:
-                        prompt_id_int = int(prompt_id)
-
-                        # Query via prompts table to get the writing content
-                        # Try both output_reference and junction table
-                        with self.prompt_repo.get_connection() as conn:
-                            cursor = conn.cursor()
-
-                            # First try output_reference (legacy single writing link)
-                            # Support both 'lyrics_prompt' (new JSON) and 'song_prompt' (old plain text)
-                            cursor.execute(
-                                """SELECT w.content, w.content_type, w.title
-                                   FROM prompts p
-                                   INNER JOIN writings w ON p.output_reference = w.id
-                                   WHERE p.id = ?
-                                     AND w.content_type IN ('lyrics_prompt', 'song_prompt')""",
-                                (prompt_id_int,)
-                            )
-                            result = cursor.fetchone()
-
-                            # If not found, try junction table (newer multi-writing support)
-                            if not result:
-                                cursor.execute(
-                                    """SELECT w.content, w.content_type, w.title
-                                       FROM prompt_writings pw
-                                       INNER JOIN writings w ON pw.writing_id = w.id
-                                       WHERE pw.prompt_id = ?
-                                         AND w.content_type IN ('lyrics_prompt', 'song_prompt')
-                                       ORDER BY pw.writing_order ASC
-                                       LIMIT 1""",
-                                    (prompt_id_int,)
-                                )
-                                result = cursor.fetchone()
-
-                            if result:
-                                content, content_type, db_title = result
-
-                                # Handle new JSON format (lyrics_prompt)
-                                if content_type == 'lyrics_prompt':
-                                    try:
-                                        json_data = json.loads(content)
-                                        song_title = json_data.get('title', '(No title)')
-                                    except json.JSONDecodeError:
-                                        song_title = db_title or '(Parse error)'
-                                # Handle old plain text format (song_prompt)
-                                elif content_type == 'song_prompt':
-                                    song_title = db_title or f"Song #{prompt_id}"
-                                else:
-                                    song_title = db_title or '(Unknown format)'
-
-                                print(f"Found song title for prompt {prompt_id}: {song_title}")
-                            else:
-                                print(f"No database record found for prompt {prompt_id}")
-                    except (ValueError, json.JSONDecodeError) as e:
-                        print(f"Failed to parse prompt {prompt_id}: {e}")
-                        import traceback
-                        traceback.print_exc()
-                except Exception as e:
-                    print(f"Failed to fetch song title for prompt {prompt_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-            # Insert into treeview
-            self.playlist.insert('', 'end', values=(f"#{prompt_id}", filename, song_title))
+                    data = json.loads(content)
+                except (TypeError, ValueError):
+                    data = None
+                if isinstance(data, dict):
+                    titles[prompt_id] = data.get('title', '(No title)')
+                else:
+                    titles[prompt_id] = db_title or '(Parse error)'
+            # Handle old plain text format (song_prompt)
+            elif content_type == 'song_prompt':
+                titles[prompt_id] = db_title or f"Song #{prompt_id}"
+            else:
+                titles[prompt_id] = db_title or '(Unknown format)'
+
+        print(f"Found song titles for {len(titles)} of {len(ids)} prompts")
+        return titles
 
     def on_file_select(self, event):
         """Handle file selection from playlist (Treeview)"""
@@ -516,20 +890,25 @@ class AudioPlayer:
             return
 
         if self.audio_backend == 'pygame':
-            import pygame
+            music = pygame.mixer.music
 
             if self.is_playing:
-                pygame.mixer.music.pause()
+                music.pause()
                 self.play_button.config(text="▶ Play")
                 self.is_playing = False
             else:
-                if pygame.mixer.music.get_busy():
-                    pygame.mixer.music.unpause()
+                if music.get_busy():
+                    music.unpause()
                 else:
-                    pygame.mixer.music.load(str(self.current_file))
-                    pygame.mixer.music.play()
+                    music.load(str(self.current_file))
+                    music.play()
                 self.play_button.config(text="⏸ Pause")
                 self.is_playing = True
+                # Restart the refresh chain (a quick pause/play may leave one queued)
+                if self._playback_after_id is not None:
+                    self.frame.after_cancel(self._playback_after_id)
+                    self._playback_after_id = None
+                self._last_displayed_second = None
                 self._start_playback_update()
         else:
             # System command fallback
@@ -548,34 +927,37 @@ class AudioPlayer:
     def stop_playback(self):
         """Stop audio playback"""
         if self.audio_backend == 'pygame':
-            import pygame
             pygame.mixer.music.stop()
 
         self.is_playing = False
         self.play_button.config(text="▶ Play")
         self.time_label.config(text="0:00 / 0:00")
+        self._last_displayed_second = None
 
     def _start_playback_update(self):
         """Update playback position display"""
+        self._playback_after_id = None
         if not self.is_playing:
             return
 
         if self.audio_backend == 'pygame':
-            import pygame
+            music = pygame.mixer.music
 
             # Get current position
-            if pygame.mixer.music.get_busy():
-                pos_ms = pygame.mixer.music.get_pos()
-
-                # Update time label
-                current_time = pos_ms / 1000.0
-                total_time = self.audio_duration_ms / 1000.0
-                self.time_label.config(
-                    text=f"{self._format_time(current_time)} / {self._format_time(total_time)}"
-                )
-
-                # Schedule next update
-                self.frame.after(50, self._start_playback_update)
+            if music.get_busy():
+                pos_ms = music.get_pos()
+
+                # Label shows whole seconds; only touch it when that changes
+                current_second = pos_ms // 1000
+                if current_second != self._last_displayed_second:
+                    self._last_displayed_second = current_second
+                    total_time = self.audio_duration_ms / 1000.0
+                    self.time_label.config(
+                        text=f"{self._format_time(current_second)} / {self._format_time(total_time)}"
+                    )
+
+                # Schedule next update (twice a second is enough for M:SS)
+                self._playback_after_id = self.frame.after(500, self._start_playback_update)
             else:
                 # Playback finished
                 self.is_playing = False